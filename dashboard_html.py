@@ -93,6 +93,7 @@ def generate_dashboard_html(report):
         .chart-card:nth-child(1){{animation-delay:.35s}} .chart-card:nth-child(2){{animation-delay:.4s}}
         .chart-title {{ font-size: 14px; text-transform: uppercase; letter-spacing: 1px; color: var(--text-muted); margin-bottom: 20px; }}
         .chart-box {{ position: relative; height: 260px; }}
+        .chart-wide {{ margin-bottom: 32px; animation-delay: .42s; }}
         .tbl-card {{ background: var(--bg-card); border: 1px solid var(--border); border-radius: 16px; padding: 24px; animation: fadeUp 0.8s ease-out backwards; animation-delay: .45s; margin-bottom: 32px; }}
         table {{ width: 100%; border-collapse: collapse; }}
         th {{ text-align: left; padding: 12px 16px; font-size: 11px; text-transform: uppercase; letter-spacing: 1px; color: var(--text-muted); border-bottom: 1px solid var(--border); }}
@@ -134,12 +135,13 @@ def generate_dashboard_html(report):
         <div class="card"><div class="card-label">Закритих запитів</div><div class="card-value v-emerald" id="m-closed">0</div><div class="card-unit">за тиждень</div></div>
         <div class="card"><div class="card-label">Час обробки</div><div class="card-value v-amber" id="m-proc">0</div><div class="card-unit">годин (середній)</div></div>
         <div class="card"><div class="card-label">Час реакції</div><div class="card-value v-violet" id="m-react">0</div><div class="card-unit">годин (середній)</div></div>
-        <div class="card"><div class="card-label">Прострочені</div><div class="card-value v-rose" id="m-over">0</div><div class="card-unit">запитів &gt;24г</div></div>
+        <div class="card"><div class="card-label">Прострочені</div><div class="card-value v-rose" id="m-over">0</div><div class="card-unit">запитів за SLA</div></div>
     </div>
     <div class="charts">
         <div class="chart-card"><div class="chart-title">📂 Розподіл по послугах</div><div class="chart-box"><canvas id="c-svc"></canvas></div></div>
         <div class="chart-card"><div class="chart-title">📋 Навантаження консультантів</div><div class="chart-box"><canvas id="c-wl"></canvas></div></div>
     </div>
+    <div class="chart-card chart-wide" id="sla-card"><div class="chart-title">⏱️ Відкриті та прострочені запити по годинах</div><div class="chart-box"><canvas id="c-sla"></canvas></div></div>
     <div class="tbl-card">
         <div class="chart-title">🏆 Консультанти — відкриті запити</div>
         <table><thead><tr><th>Консультант</th><th>Відкритих</th><th style="width:50%">Навантаження</th></tr></thead><tbody id="tbl"></tbody></table>
@@ -173,6 +175,10 @@ new Chart(document.getElementById('c-svc'),{{type:'doughnut',data:{{labels:svcL,
 const cons=Object.keys(m.consultant_workload), wlD=Object.values(m.consultant_workload);
 new Chart(document.getElementById('c-wl'),{{type:'bar',data:{{labels:cons,datasets:[{{label:'Відкритих запитів',data:wlD,backgroundColor:COLORS.slice(0,cons.length).map(c=>c+'33'),borderColor:COLORS.slice(0,cons.length),borderWidth:2,borderRadius:8,borderSkipped:false}}]}},options:{{responsive:true,maintainAspectRatio:false,indexAxis:'y',plugins:{{legend:{{display:false}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{stepSize:1}}}},y:{{grid:{{display:false}},ticks:{{font:{{size:13,weight:500}}}}}}}},animation:{{duration:1200}}}}}});
 
+const hc=m.hourly_curves;
+if(hc){{new Chart(document.getElementById('c-sla'),{{type:'line',data:{{labels:hc.labels,datasets:[{{label:'Відкриті',data:hc.backlog,borderColor:COLORS[0],backgroundColor:COLORS[0]+'22',fill:true,pointRadius:0,tension:0.2,borderWidth:2}},{{label:'Прострочені (SLA)',data:hc.overdue,borderColor:COLORS[3],backgroundColor:COLORS[3]+'22',fill:true,pointRadius:0,tension:0.2,borderWidth:2}}]}},options:{{responsive:true,maintainAspectRatio:false,interaction:{{mode:'index',intersect:false}},plugins:{{legend:{{position:'top'}}}},scales:{{x:{{grid:{{display:false}},ticks:{{maxTicksLimit:8}}}},y:{{beginAtZero:true,grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{stepSize:1}}}}}},animation:{{duration:1200}}}}}})}}
+else document.getElementById('sla-card').style.display='none';
+
 const mx=Math.max(...wlD,1),tb=document.getElementById('tbl');
 cons.forEach((n,i)=>{{const c=wlD[i],p=c/mx*100,cl=COLORS[i%COLORS.length],av=AVATARS[i%AVATARS.length];
 tb.innerHTML+=`<tr><td><div class="name-cell"><div class="avatar" style="background:${{av}}">${{n[0].toUpperCase()}}</div>${{n}}</div></td><td style="font-family:'Space Mono',monospace;font-weight:700;color:${{cl}}">${{c}}</td><td><div class="bar-cell"><div class="bar-track"><div class="bar-fill" style="width:0%;background:${{cl}}" data-w="${{p}}%"></div></div><div class="bar-val" style="color:${{cl}}">${{c}}</div></div></td></tr>`}});
@@ -0,0 +1,386 @@
+import json
+import math
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+INFINITY = float("inf")
+
+# How far back from now business_time_index() is built. Deadlines of older
+# requests are computed day by day with add_business_hours() instead.
+INDEX_LOOKBACK_DAYS = 366
+
+DEFAULT_SLA_CONFIG = {
+    "business_hours": {
+        "timezone": "Europe/Kyiv",
+        "start": "09:00",
+        "end": "18:00",
+        "weekdays": [0, 1, 2, 3, 4],
+        "holidays": [],
+    },
+    "default": {
+        "reaction_hours": 24,
+        "resolution_hours": None,
+        "business_hours": False,
+    },
+    "services": {},
+}
+
+
+def _check_dict(name, value):
+    """
+    Checks that a config section is a JSON object.
+    """
+    if not isinstance(value, dict):
+        raise ValueError(f"SLA {name}: очікується об'єкт, отримано {value!r}")
+    return value
+
+
+def _check_rule(name, rule):
+    """
+    Checks that SLA thresholds of a rule are positive numbers or null.
+    """
+    for key in ("reaction_hours", "resolution_hours"):
+        hours = rule[key]
+        if hours is None:
+            continue
+        if isinstance(hours, bool) or not isinstance(hours, (int, float)) or hours <= 0:
+            raise ValueError(f"SLA {name}: {key} має бути додатним числом або null, отримано {hours!r}")
+    if not isinstance(rule["business_hours"], bool):
+        raise ValueError(f"SLA {name}: business_hours має бути true або false")
+
+
+def _check_calendar(calendar):
+    """
+    Parses the business_hours section.
+    """
+    for key in ("timezone", "start", "end"):
+        if not isinstance(calendar[key], str):
+            raise ValueError(f"SLA business_hours: {key} має бути рядком")
+
+    start = time.fromisoformat(calendar["start"])
+    end = time.fromisoformat(calendar["end"])
+    if start >= end:
+        raise ValueError("SLA business_hours: start має бути раніше за end")
+
+    weekdays = calendar["weekdays"]
+    if (
+        not isinstance(weekdays, list) or not weekdays
+        or any(isinstance(d, bool) or not isinstance(d, int) or not 0 <= d <= 6 for d in weekdays)
+    ):
+        raise ValueError(f"SLA business_hours: weekdays — непорожній список чисел 0–6, отримано {weekdays!r}")
+
+    holidays = calendar["holidays"]
+    if not isinstance(holidays, list) or not all(isinstance(d, str) for d in holidays):
+        raise ValueError("SLA business_hours: holidays — список дат YYYY-MM-DD")
+
+    try:
+        tz = ZoneInfo(calendar["timezone"])
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"SLA business_hours: невідома часова зона {calendar['timezone']}")
+
+    return {
+        "tz": tz,
+        "start": start,
+        "end": end,
+        "weekdays": set(weekdays),
+        "holidays": {datetime.strptime(d, "%Y-%m-%d").date() for d in holidays},
+    }
+
+
+def load_sla_config(path=None):
+    """
+    Loads SLA thresholds from a JSON file and merges them with defaults.
+
+    Without a path every service gets the default rule: a request must be
+    assigned or closed within 24 calendar hours after creation.
+    Raises OSError if the file can't be read and ValueError if it is invalid.
+    """
+    raw = {}
+    if path:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+    _check_dict("config", raw)
+
+    calendar = _check_calendar({
+        **DEFAULT_SLA_CONFIG["business_hours"],
+        **_check_dict("business_hours", raw.get("business_hours", {})),
+    })
+    default_rule = {
+        **DEFAULT_SLA_CONFIG["default"],
+        **_check_dict("default", raw.get("default", {})),
+    }
+    services = {
+        service: {**default_rule, **_check_dict(f"services.{service}", rule)}
+        for service, rule in _check_dict("services", raw.get("services", {})).items()
+    }
+    _check_rule("default", default_rule)
+    for service, rule in services.items():
+        _check_rule(f"services.{service}", rule)
+
+    if path:
+        print(f"SLA налаштування завантажено: {path}")
+
+    return {
+        "business_hours": calendar,
+        "default": default_rule,
+        "services": services,
+    }
+
+
+def add_business_hours(start, hours, calendar):
+    """
+    Returns the moment when the given number of working hours has passed.
+
+    Working time is counted only inside the daily window of the calendar,
+    on working weekdays that are not holidays.
+    """
+    tz = calendar["tz"]
+    remaining = timedelta(hours=hours)
+    current = start.astimezone(tz)
+
+    while True:
+        day = current.date()
+        if day.weekday() in calendar["weekdays"] and day not in calendar["holidays"]:
+            day_start = datetime.combine(day, calendar["start"], tzinfo=tz)
+            day_end = datetime.combine(day, calendar["end"], tzinfo=tz)
+            begin = max(current, day_start)
+            if begin < day_end:
+                available = day_end - begin
+                if remaining <= available:
+                    return begin + remaining
+                remaining -= available
+        current = datetime.combine(day + timedelta(days=1), time(0), tzinfo=tz)
+
+
+def business_time_index(calendar, first_day, last_day):
+    """
+    Builds working windows of the calendar between two dates.
+
+    cumulative[i] is the number of working seconds before window i, so the
+    working time between any two moments is a difference of two lookups.
+    """
+    tz = calendar["tz"]
+    since = datetime.combine(first_day, time(0), tzinfo=tz).timestamp()
+    starts, ends, cumulative = [], [], [0.0]
+
+    day = first_day
+    while day <= last_day:
+        if day.weekday() in calendar["weekdays"] and day not in calendar["holidays"]:
+            start = datetime.combine(day, calendar["start"], tzinfo=tz).timestamp()
+            end = datetime.combine(day, calendar["end"], tzinfo=tz).timestamp()
+            starts.append(start)
+            ends.append(end)
+            cumulative.append(cumulative[-1] + end - start)
+        day += timedelta(days=1)
+
+    return {"since": since, "starts": starts, "ends": ends, "cumulative": cumulative}
+
+
+def business_deadline(created_ts, hours, index):
+    """
+    Same as add_business_hours(), but on epoch seconds using the window index.
+    Returns None if the request or its deadline falls outside the indexed dates.
+    """
+    if created_ts < index["since"]:
+        return None
+    starts, ends, cumulative = index["starts"], index["ends"], index["cumulative"]
+
+    i = bisect_right(starts, created_ts) - 1
+    if i >= 0 and created_ts < ends[i]:
+        worked = cumulative[i] + created_ts - starts[i]
+    else:
+        worked = cumulative[i + 1]
+
+    target = worked + hours * 3600
+    j = bisect_left(cumulative, target) - 1
+    if j < 0 or j >= len(starts):
+        return None
+    return max(created_ts, starts[j] + target - cumulative[j])
+
+
+def _business_index_for(created, sla_config, now_ts):
+    """
+    Builds business_time_index() for deadlines of requests created during
+    the last INDEX_LOOKBACK_DAYS, so a few very old or far-future rows can't
+    stretch it.
+    """
+    calendar = sla_config["business_hours"]
+    rules = [sla_config["default"], *sla_config["services"].values()]
+    max_hours = max(
+        (h for rule in rules if rule["business_hours"]
+         for h in (rule["reaction_hours"], rule["resolution_hours"]) if h is not None),
+        default=None,
+    )
+    if max_hours is None or not created:
+        return None
+
+    window_hours = (
+        datetime.combine(date.min, calendar["end"]) - datetime.combine(date.min, calendar["start"])
+    ).total_seconds() / 3600
+    work_days = math.ceil(max_hours / window_hours) + 1
+    pad_days = math.ceil(work_days * 7 / len(calendar["weekdays"])) + len(calendar["holidays"]) + 7
+
+    tz = calendar["tz"]
+    first_ts = min(max(min(created), now_ts - INDEX_LOOKBACK_DAYS * 86400), now_ts)
+    first_day = datetime.fromtimestamp(first_ts, tz).date() - timedelta(days=1)
+    last_day = datetime.fromtimestamp(now_ts, tz).date() + timedelta(days=pad_days)
+    return business_time_index(calendar, first_day, last_day)
+
+
+def overdue_intervals(created, assigned, closed, services, sla_config, now=None):
+    """
+    Derives when each request was overdue from its timestamps.
+
+    Reaction SLA ends when the request is assigned or closed, resolution SLA
+    ends when it is closed. Each stage finished after its deadline (or not
+    finished yet) gives an interval [deadline, finish) in epoch seconds;
+    intervals of both stages are merged.
+
+    Also returns, per row, the reaction deadline of requests that are still
+    neither assigned nor closed (None otherwise). That is the only stage the
+    upstream "More then 24 hours" status describes.
+    Arguments:
+        created, assigned, closed (list[datetime | None]): timestamp columns
+        services (list[str]): service column
+        sla_config (dict): result of load_sla_config()
+        now (datetime): moment of the check, defaults to current time
+    Returns:
+        tuple[list, list]: sorted, non-overlapping intervals per row and
+            pending reaction deadlines per row
+    """
+    created_ts = [c.timestamp() if c else None for c in created]
+    assigned_ts = [a.timestamp() if a else None for a in assigned]
+    closed_ts = [cl.timestamp() if cl else None for cl in closed]
+
+    now_ts = (now or datetime.now(sla_config["business_hours"]["tz"])).timestamp()
+    index = _business_index_for([c for c in created_ts if c is not None], sla_config, now_ts)
+    calendar = sla_config["business_hours"]
+
+    def deadline(row, hours, business_hours):
+        if hours is None:
+            return None
+        if not business_hours:
+            return created_ts[row] + hours * 3600
+        due = business_deadline(created_ts[row], hours, index)
+        if due is None:
+            due = add_business_hours(created[row], hours, calendar).timestamp()
+        return due
+
+    rule_by_service = {}
+    default_rule = sla_config["default"]
+
+    # Most requests never breach, so they share one empty tuple instead of
+    # allocating a list per row.
+    no_intervals = ()
+    result = []
+    reaction_pending = []
+    for row, (c, a, cl, service) in enumerate(zip(created_ts, assigned_ts, closed_ts, services)):
+        if c is None:
+            result.append(no_intervals)
+            reaction_pending.append(None)
+            continue
+
+        rule = rule_by_service.get(service)
+        if rule is None:
+            rule = sla_config["services"].get(service, default_rule)
+            rule = rule_by_service[service] = (
+                rule["reaction_hours"], rule["resolution_hours"], rule["business_hours"],
+            )
+        reaction_hours, resolution_hours, business_hours = rule
+
+        reacted = a if cl is None else cl if a is None else min(a, cl)
+        reaction_pending.append(
+            deadline(row, reaction_hours, business_hours) if reacted is None else None
+        )
+        intervals = no_intervals
+        for hours, finished in ((reaction_hours, reacted), (resolution_hours, cl)):
+            due = deadline(row, hours, business_hours)
+            if due is None or (finished is not None and finished <= due):
+                continue
+            interval = (due, INFINITY if finished is None else finished)
+            if not intervals:
+                intervals = (interval,)
+            else:
+                (s1, e1), (s2, e2) = sorted((intervals[0], interval))
+                intervals = ((s1, max(e1, e2)),) if s2 <= e1 else ((s1, e1), (s2, e2))
+        result.append(intervals)
+
+    return result, reaction_pending
+
+
+def is_overdue_at(intervals, moment):
+    """
+    Checks whether a request is overdue at the given epoch time.
+    """
+    return any(start <= moment < end for start, end in intervals)
+
+
+def build_interval_index(intervals):
+    """
+    Builds an index of half-open intervals: sorted starts and sorted ends.
+    """
+    return {
+        "starts": sorted(start for start, _ in intervals),
+        "ends": sorted(end for _, end in intervals),
+    }
+
+
+def count_active(index, moments):
+    """
+    Counts intervals active at each moment.
+
+    An interval [start, end) is active at T when start <= T < end, so the
+    count is (starts <= T) - (ends <= T): two binary searches per moment
+    instead of a scan over all requests.
+    """
+    starts, ends = index["starts"], index["ends"]
+    return [bisect_right(starts, t) - bisect_right(ends, t) for t in moments]
+
+
+def count_started(index, since, until):
+    """
+    Counts intervals that started in [since, until).
+    """
+    return bisect_left(index["starts"], until) - bisect_left(index["starts"], since)
+
+
+def hourly_moments(since, until):
+    """
+    Returns whole hours from since to until inclusive, in the timezone of since.
+
+    Hours are stepped in epoch seconds, so across a DST change no real hour
+    is skipped and no nonexistent local hour is produced.
+    """
+    tz = since.tzinfo
+    first = math.ceil(since.timestamp() / 3600) * 3600
+    last = until.timestamp()
+    return [datetime.fromtimestamp(ts, tz) for ts in range(first, math.floor(last) + 1, 3600)]
+
+
+def sla_curves(requests, since, until):
+    """
+    Builds hourly backlog and overdue curves for the period.
+    Arguments:
+        requests (list[dict]): validated requests with "sla_intervals"
+        since (datetime): period start
+        until (datetime): period end
+    Returns:
+        dict: hour labels, open requests and overdue requests per hour
+    """
+    backlog_index = build_interval_index(
+        (r["created_at"].timestamp(), r["closed_at"].timestamp() if r["closed_at"] else INFINITY)
+        for r in requests if r["created_at"]
+    )
+    overdue_index = build_interval_index(
+        interval for r in requests for interval in r["sla_intervals"]
+    )
+
+    moments = hourly_moments(since, until)
+    timestamps = [m.timestamp() for m in moments]
+    return {
+        "labels": [m.strftime("%Y-%m-%d %H:%M") for m in moments],
+        "backlog": count_active(backlog_index, timestamps),
+        "overdue": count_active(overdue_index, timestamps),
+        "breaches_started": count_started(overdue_index, since.timestamp(), until.timestamp()),
+    }
@@ -1,41 +1,70 @@
 import os
+import re
+import sys
 import json
 import csv
-import smtplib
-from datetime import datetime, timedelta
+import argparse
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
 from collections import Counter
+from itertools import compress
 
-from pyairtable import Api
-from dotenv import load_dotenv
-from  dashboard_html import generate_dashboard_html, save_dashboard
+from sla import load_sla_config, overdue_intervals, is_overdue_at, sla_curves
 
-load_dotenv()
+# Heavy dependencies (pyairtable, smtplib, email.mime, dashboard_html, dotenv)
+# are imported inside the functions that need them, so that cron runs which
+# only validate config or reuse cached output start quickly.
 
-AIRTABLE_API_KEY = os.getenv("AIRTABLE_API_KEY")
-AIRTABLE_BASE_ID = os.getenv("AIRTABLE_BASE_ID")
 AIRTABLE_TABLE_NAME = "Requests"
 
-SMTP_HOST = os.getenv("SMTP_HOST")
-SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
-SMTP_USER = os.getenv("SMTP_USER")
-SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
-EMAIL_FROM = os.getenv("EMAIL_FROM")
-EMAIL_TO = os.getenv("EMAIL_TO")
-
 REPORTS_DIR = "reports"
+SLA_CONFIG_PATH = "sla.json"
+
+REQUIRED_VARS = ["AIRTABLE_API_KEY", "AIRTABLE_BASE_ID"]
+EMAIL_VARS = ["SMTP_HOST", "SMTP_USER", "SMTP_PASSWORD", "EMAIL_FROM", "EMAIL_TO"]
+
+
+def load_config():
+    """
+    Loads .env and returns configuration from environment variables.
+    """
+    from dotenv import load_dotenv
 
+    load_dotenv()
 
-def fetch_all_requests():
+    config = {name: os.getenv(name) for name in REQUIRED_VARS + EMAIL_VARS}
+    config["SMTP_PORT"] = int(os.getenv("SMTP_PORT", "587"))
+    return config
+
+
+def check_required_config(config):
+    """
+    Checks that Airtable variables are set, prints a hint if not.
+    """
+    missing = [name for name in REQUIRED_VARS if not config[name]]
+    if missing:
+        print(f"Відсутні обов'язкові змінні середовища: {', '.join(missing)}")
+        print("Створіть .env файл за прикладом .env.example")
+        print("Або встановіть змінні: export AIRTABLE_API_KEY=pat_xxx...")
+        return False
+    return True
+
+
+def is_email_configured(config):
+    """
+    Checks that all SMTP variables are set.
+    """
+    return all(config[name] for name in EMAIL_VARS)
+
+
+def fetch_all_requests(config):
     """
     Get all fields from requests table in Airtable.
     """
-    api = Api(AIRTABLE_API_KEY)
-    table = api.table(AIRTABLE_BASE_ID, AIRTABLE_TABLE_NAME)
+    from pyairtable import Api
+
+    api = Api(config["AIRTABLE_API_KEY"])
+    table = api.table(config["AIRTABLE_BASE_ID"], AIRTABLE_TABLE_NAME)
 
     records = table.all()
 
@@ -43,65 +72,198 @@ def fetch_all_requests():
     return records
 
 
+# Same tzinfo object that datetime.fromisoformat() gives for a "Z" suffix, so
+# comparisons between parsed timestamps skip the utcoffset() lookups.
+UTC = timezone.utc
+
+DATETIME_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d",
+]
+
+# Shape of the DATETIME_FORMATS above. Values that match it are parsed with
+# datetime.fromisoformat() (much faster than strptime); other ISO 8601
+# spellings it would also accept ("20261019", "2026-W42-1", offsets) are
+# rejected as Airtable never sends them.
+DATETIME_SHAPE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?:T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?Z?)?",
+    re.ASCII,
+).fullmatch
+
+OVERDUE_STATUS = "More then 24 hours"
+
+# Reason codes of the data-quality check. Records with any of the
+# QUARANTINE_REASONS are excluded from metrics; the rest are only reported.
+QUARANTINE_REASONS = [
+    "missing_created_at",
+    "invalid_created_at",
+    "invalid_assigned_at",
+    "invalid_closed_at",
+    "created_in_future",
+    "assigned_before_created",
+    "closed_before_created",
+]
+WARNING_REASONS = [
+    "overdue_status_mismatch",
+]
+
+
 def parse_datetime(value):
     """
     Converts a date string from Airtable to a datetime object.
+    Returns None for values that don't match DATETIME_FORMATS.
     """
-    if not value:
+    if not value or not isinstance(value, str) or not DATETIME_SHAPE(value):
         return None
 
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d",
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        # Python < 3.11 fromisoformat() rejects the "Z" suffix; strptime is
+        # the reference for those versions and for impossible dates.
+        dt = None
+        for fmt in DATETIME_FORMATS:
+            try:
+                dt = datetime.strptime(value, fmt)
+                break
+            except ValueError:
+                continue
+        if dt is None:
+            return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def validate_records(records, now=None, sla_config=None):
+    """
+    Checks timestamps of all records and separates impossible rows.
+
+    Fields are extracted into columns once, then every check is a single
+    pass over those columns, so the cost stays linear in the number of rows.
+    Overdue state is derived from timestamps by the SLA engine (see sla.py).
+    Arguments:
+        records (list[dict]): records from Airtable
+        now (datetime): moment of the check, defaults to current time
+        sla_config (dict): result of load_sla_config(), defaults are used if not given
+    Returns:
+        dict: accepted requests, quarantined rows and anomaly counts
+    """
+    now = (now or datetime.now(ZoneInfo("Europe/Kyiv"))).astimezone(UTC)
+    now_ts = now.timestamp()
+    sla_config = sla_config or load_sla_config()
+
+    fields = [record.get("fields", {}) for record in records]
+    raw_created = [f.get("Created At") for f in fields]
+    raw_assigned = [f.get("Assigned At") for f in fields]
+    raw_closed = [f.get("Closed At") for f in fields]
+    statuses = [f.get("Status", "Unknown") for f in fields]
+    services = [(f.get("Service Name") or ["Unknown"])[0] for f in fields]
+
+    created = list(map(parse_datetime, raw_created))
+    assigned = list(map(parse_datetime, raw_assigned))
+    closed = list(map(parse_datetime, raw_closed))
+
+    checks = {
+        "missing_created_at": [not raw for raw in raw_created],
+        "invalid_created_at": [bool(raw) and dt is None for raw, dt in zip(raw_created, created)],
+        "invalid_assigned_at": [bool(raw) and dt is None for raw, dt in zip(raw_assigned, assigned)],
+        "invalid_closed_at": [bool(raw) and dt is None for raw, dt in zip(raw_closed, closed)],
+        "created_in_future": [c is not None and c > now for c in created],
+        "assigned_before_created": [
+            c is not None and a is not None and a < c for c, a in zip(created, assigned)
+        ],
+        "closed_before_created": [
+            c is not None and cl is not None and cl < c for c, cl in zip(created, closed)
+        ],
+    }
+    rejected = [any(flags) for flags in zip(*(checks[reason] for reason in QUARANTINE_REASONS))]
+    accepted = [i for i, is_rejected in enumerate(rejected) if not is_rejected]
+
+    # SLA runs only on accepted rows: rejected ones may carry dates that
+    # can't be placed on the business-hours calendar.
+    intervals, reaction_pending = overdue_intervals(
+        [created[i] for i in accepted],
+        [assigned[i] for i in accepted],
+        [closed[i] for i in accepted],
+        [services[i] for i in accepted],
+        sla_config,
+        now,
+    )
+    overdue = [is_overdue_at(iv, now_ts) for iv in intervals]
+
+    # The upstream status only describes the reaction stage, so it is
+    # compared with the reaction breach, not with the whole SLA result.
+    mismatch = [False] * len(records)
+    for i, due in zip(accepted, reaction_pending):
+        mismatch[i] = (statuses[i] == OVERDUE_STATUS) != (due is not None and due <= now_ts)
+    checks["overdue_status_mismatch"] = mismatch
+    anomaly_counts = {reason: sum(mask) for reason, mask in checks.items()}
+
+    reasons = {}
+    for reason, mask in checks.items():
+        for i in compress(range(len(records)), mask):
+            reasons.setdefault(i, []).append(reason)
+
+    quarantine = [
+        {
+            "record_id": records[i].get("id", ""),
+            "request_id": fields[i].get("Request ID", "N/A"),
+            "status": statuses[i],
+            "created_at": raw_created[i],
+            "assigned_at": raw_assigned[i],
+            "closed_at": raw_closed[i],
+            "reasons": reasons[i],
+            "excluded": rejected[i],
+        }
+        for i in sorted(reasons)
     ]
 
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(value, fmt)
-            return dt.replace(tzinfo=ZoneInfo("UTC"))
-        except ValueError:
-            continue
+    requests = [
+        {
+            "request_id": fields[i].get("Request ID", "N/A"),
+            "status": statuses[i],
+            "assignee": (fields[i].get("Assignee Name") or ["Unassigned"])[0],
+            "service": services[i],
+            "description": fields[i].get("Description", ""),
+            "created_at": created[i],
+            "assigned_at": assigned[i],
+            "closed_at": closed[i],
+            "overdue": is_overdue,
+            "sla_intervals": iv,
+        }
+        for i, is_overdue, iv in zip(accepted, overdue, intervals)
+    ]
 
-    return None
+    return {
+        "requests": requests,
+        "quarantine": quarantine,
+        "quarantined_count": sum(rejected),
+        "anomaly_counts": anomaly_counts,
+    }
 
 
-def calculate_metrics(records):
+def calculate_metrics(records, validation=None, sla_config=None, now=None):
     """
     Calculates all metrics for the weekly report.
     Arguments:
         records (list[dict]): records from Airtable
+        validation (dict): result of validate_records(), computed if not given
+        sla_config (dict): SLA thresholds used when validation is computed here
+        now (datetime): end of the report period, defaults to current time
     Returns:
         dict: structured report with metrics and details
     """
-    now = datetime.now(ZoneInfo("Europe/Kyiv"))
+    now = (now or datetime.now()).astimezone(ZoneInfo("Europe/Kyiv"))
     week_ago = now - timedelta(days=7)
 
-    all_requests = []
-    for record in records:
-        fields = record.get("fields", {})
-
-        created_at = parse_datetime(fields.get("Created At"))
-        assigned_at = parse_datetime(fields.get("Assigned At"))
-        closed_at = parse_datetime(fields.get("Closed At"))
-        status = fields.get("Status", "Unknown")
-
-        assignee_name = (fields.get("Assignee Name") or ["Unassigned"])[0]
-
-        service = (fields.get("Service Name") or ["Unknown"])[0]
-
-        all_requests.append({
-            "request_id": fields.get("Request ID", "N/A"),
-            "status": status,
-            "assignee": assignee_name,
-            "service": service,
-            "description": fields.get("Description", ""),
-            "created_at": created_at,
-            "assigned_at": assigned_at,
-            "closed_at": closed_at,
-        })
+    if validation is None:
+        validation = validate_records(records, now, sla_config)
+    all_requests = validation["requests"]
 
     new_this_week = [
         r for r in all_requests
@@ -136,9 +298,8 @@ def calculate_metrics(records):
         1 for r in all_requests if r["status"] == "In progress"
     )
 
-    overdue_count = sum(
-        1 for r in all_requests if r["status"] == "More then 24 hours"
-    )
+    overdue_count = sum(1 for r in all_requests if r["overdue"])
+    hourly_curves = sla_curves(all_requests, week_ago, now)
 
     reaction_times = []
     for r in all_requests:
@@ -160,7 +321,7 @@ def calculate_metrics(records):
 
     open_by_consultant = Counter(
         r["assignee"] for r in all_requests
-        if r["status"] not in ("Closed", "More then 24 hours") and r["assignee"] != "Unassigned"
+        if r["closed_at"] is None and r["assignee"] != "Unassigned"
     )
 
     total_requests = len(all_requests)
@@ -178,10 +339,14 @@ def calculate_metrics(records):
             ],
             "in_progress_count": in_progress_count,
             "overdue_count": overdue_count,
+            "sla_breaches_this_week": hourly_curves.pop("breaches_started"),
             "avg_reaction_time_hours": avg_reaction_time_hours,
             "total_requests": total_requests,
             "service_stats": service_stats,
             "consultant_workload": dict(open_by_consultant),
+            "quarantined_count": validation["quarantined_count"],
+            "anomaly_counts": validation["anomaly_counts"],
+            "hourly_curves": hourly_curves,
         },
         "details": {
             "new_requests": [
@@ -242,8 +407,16 @@ def save_csv(report, directory, filename):
         writer.writerow(["Середній час обробки (годин)", metrics["avg_processing_time_hours"]])
         writer.writerow(["Середній час реакції (годин)", metrics["avg_reaction_time_hours"]])
         writer.writerow(["Запитів у роботі", metrics["in_progress_count"]])
-        writer.writerow(["Прострочених запитів (>24г)", metrics["overdue_count"]])
+        writer.writerow(["Прострочених запитів (SLA)", metrics["overdue_count"]])
+        writer.writerow(["Порушень SLA за тиждень", metrics["sla_breaches_this_week"]])
         writer.writerow(["Загальна кількість запитів", metrics["total_requests"]])
+        writer.writerow(["Відхилених записів (якість даних)", metrics["quarantined_count"]])
+        writer.writerow([])
+
+        writer.writerow(["--- ЯКІСТЬ ДАНИХ (аномалії) ---"])
+        writer.writerow(["Код", "Кількість записів"])
+        for reason, count in metrics["anomaly_counts"].items():
+            writer.writerow([reason, count])
         writer.writerow([])
 
         writer.writerow(["--- ТОП-3 КОНСУЛЬТАНТИ (закриті запити) ---"])
@@ -283,6 +456,27 @@ def save_csv(report, directory, filename):
     return filepath
 
 
+def save_quarantine(quarantine, directory, filename):
+    """
+    Save records rejected by the data-quality check in CSV format.
+    """
+    filepath = os.path.join(directory, filename)
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "Record ID", "Request ID", "Status", "Created At", "Assigned At", "Closed At",
+            "Reasons", "Excluded",
+        ])
+        for row in quarantine:
+            writer.writerow([
+                row["record_id"], row["request_id"], row["status"],
+                row["created_at"], row["assigned_at"], row["closed_at"],
+                ";".join(row["reasons"]), row["excluded"],
+            ])
+    print(f"Карантин записів збережено: {filepath}")
+    return filepath
+
+
 def format_email_body(report):
     """
     Generates HTML body of report email.
@@ -349,7 +543,7 @@ def format_email_body(report):
             </div>
             <div class="metric-card">
                 <div class="metric-value">{metrics['overdue_count']}</div>
-                <div class="metric-label">Прострочених (&gt;24г)</div>
+                <div class="metric-label">Прострочених (SLA)</div>
             </div>
         </div>
 
@@ -382,7 +576,7 @@ def format_email_body(report):
     return html
 
 
-def send_email(report, csv_path, json_path, dashboard_path):
+def send_email(report, csv_path, json_path, dashboard_path, config):
     """
     Sends a report to the email manager.
 
@@ -391,10 +585,19 @@ def send_email(report, csv_path, json_path, dashboard_path):
     - Attached CSV file
     - Attached JSON file
     - Attached interactive HTML dashboard
+
+    Returns:
+        bool: True if the email was sent
     """
+    import smtplib
+    from email import encoders
+    from email.mime.base import MIMEBase
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
     msg = MIMEMultipart()
-    msg["From"] = EMAIL_FROM
-    msg["To"] = EMAIL_TO
+    msg["From"] = config["EMAIL_FROM"]
+    msg["To"] = config["EMAIL_TO"]
     msg["Subject"] = f"📊 TechFlow — Щотижневий звіт ({report['period']})"
 
     html_body = format_email_body(report)
@@ -409,64 +612,84 @@ def send_email(report, csv_path, json_path, dashboard_path):
             msg.attach(part)
 
     try:
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
+        with smtplib.SMTP(config["SMTP_HOST"], config["SMTP_PORT"]) as server:
             server.starttls()
-            server.login(SMTP_USER, SMTP_PASSWORD)
+            server.login(config["SMTP_USER"], config["SMTP_PASSWORD"])
             server.send_message(msg)
-        print(f"Звіт надіслано на {EMAIL_TO}")
+        print(f"Звіт надіслано на {config['EMAIL_TO']}")
+        return True
     except Exception as e:
         print(f"Помилка відправки email: {e}")
         print("Перевірте SMTP налаштування у .env файлі")
+        return False
 
 
-def main():
+def report_paths(date_str):
     """
-    Entry point into the application. Performs the following in sequence:
-    1. Check configuration (.env variables)
-    2. Get data from Airtable
-    3. Calculate metrics
-    4. Output results to the console
-    5. Save to JSON and CSV
-    6. Send to email
+    Returns paths of all files produced for the given report date.
     """
-    print("=" * 60)
-    print("  TechFlow Consulting — Weekly Report Generator")
-    print("=" * 60)
-    print()
-
-    required_vars = {
-        "AIRTABLE_API_KEY": AIRTABLE_API_KEY,
-        "AIRTABLE_BASE_ID": AIRTABLE_BASE_ID,
+    date_dir = os.path.join(REPORTS_DIR, date_str)
+    return {
+        "dir": date_dir,
+        "records": os.path.join(date_dir, f"techflow_records_{date_str}.json"),
+        "json": os.path.join(date_dir, f"techflow_report_{date_str}.json"),
+        "csv": os.path.join(date_dir, f"techflow_report_{date_str}.csv"),
+        "dashboard": os.path.join(date_dir, f"techflow_dashboard_{date_str}.html"),
+        "quarantine": os.path.join(date_dir, f"techflow_quarantine_{date_str}.csv"),
     }
-    missing = [name for name, value in required_vars.items() if not value]
 
-    if missing:
-        print(f"Відсутні обов'язкові змінні середовища: {', '.join(missing)}")
-        print("Створіть .env файл за прикладом .env.example")
-        print("Або встановіть змінні: export AIRTABLE_API_KEY=pat_xxx...")
-        return
 
-    email_vars = [SMTP_HOST, SMTP_USER, SMTP_PASSWORD, EMAIL_FROM, EMAIL_TO]
-    email_configured = all(email_vars)
-    if not email_configured:
-        print("Email не налаштований — звіт буде збережений тільки у файли")
-        print()
+def save_records(records, filepath, fetched_at):
+    """
+    Save raw Airtable records with the time they were fetched, so later
+    steps can run without the API and still report as of that moment.
+    """
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump({"fetched_at": fetched_at.isoformat(), "records": records}, f, ensure_ascii=False)
+    print(f"Дані Airtable збережено: {filepath}")
+    return filepath
 
-    print("Отримання даних з Airtable...")
-    try:
-        records = fetch_all_requests()
-    except Exception as e:
-        print(f"Помилка підключення до Airtable: {e}")
-        print("Перевірте AIRTABLE_API_KEY та AIRTABLE_BASE_ID у .env")
-        return
 
-    if not records:
-        print("Таблиця Requests порожня — немає даних для звіту")
-        return
+def load_records(filepath):
+    """
+    Load records saved by save_records().
+    Returns:
+        tuple[list | None, datetime | None]: records (None if the file does not
+            exist) and the time they were fetched (None for files saved without it)
+    """
+    saved = load_json(filepath)
+    if saved is None or isinstance(saved, list):
+        return saved, None
+    return saved["records"], datetime.fromisoformat(saved["fetched_at"])
 
-    print("Розрахунок метрик...")
-    report = calculate_metrics(records)
 
+def latest_report_date():
+    """
+    Returns the newest reports/<date> directory with fetched records, or None.
+    """
+    if not os.path.isdir(REPORTS_DIR):
+        return None
+    for date_str in sorted(os.listdir(REPORTS_DIR), reverse=True):
+        if os.path.exists(report_paths(date_str)["records"]):
+            return date_str
+    return None
+
+
+def load_json(filepath):
+    """
+    Load a previously saved JSON file, or None if it does not exist.
+    """
+    if not os.path.exists(filepath):
+        print(f"Файл не знайдено: {filepath}")
+        return None
+    with open(filepath, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_summary(report):
+    """
+    Outputs key metrics to the console.
+    """
     metrics = report["metrics"]
     print()
     print(f"  Період: {report['period']}")
@@ -475,8 +698,10 @@ def main():
     print(f"  Середній час обробки:         {metrics['avg_processing_time_hours']} годин")
     print(f"  Середній час реакції:          {metrics['avg_reaction_time_hours']} годин")
     print(f"  У роботі зараз:               {metrics['in_progress_count']}")
-    print(f"  Прострочених (>24г):          {metrics['overdue_count']}")
+    print(f"  Прострочених (SLA):           {metrics['overdue_count']}")
+    print(f"  Порушень SLA за тиждень:      {metrics['sla_breaches_this_week']}")
     print(f"  Загальна кількість:            {metrics['total_requests']}")
+    print(f"  Відхилено (якість даних):      {metrics['quarantined_count']}")
     print()
 
     if metrics["top_3_consultants"]:
@@ -488,28 +713,220 @@ def main():
     print()
 
 
-    date_str = datetime.now(ZoneInfo("Europe/Kyiv")).strftime("%Y-%m-%d")
-    date_dir = os.path.join(REPORTS_DIR, date_str)
-    os.makedirs(date_dir, exist_ok=True)
+def cmd_validate_config(args):
+    """
+    Checks .env configuration without touching Airtable or SMTP.
+    """
+    config = load_config()
+    if not check_required_config(config):
+        return 1
+    if not is_email_configured(config):
+        print("Email не налаштований — звіт буде збережений тільки у файли")
+    print("Конфігурація в порядку")
+    return 0
+
+
+def cmd_fetch(args):
+    """
+    Gets records from Airtable and caches them in the report directory.
+    """
+    config = load_config()
+    if not check_required_config(config):
+        return 1
+
+    print("Отримання даних з Airtable...")
+    try:
+        records = fetch_all_requests(config)
+    except Exception as e:
+        print(f"Помилка підключення до Airtable: {e}")
+        print("Перевірте AIRTABLE_API_KEY та AIRTABLE_BASE_ID у .env")
+        return 1
+
+    if not records:
+        print("Таблиця Requests порожня — немає даних для звіту")
+        return 1
+
+    paths = report_paths(args.date)
+    os.makedirs(paths["dir"], exist_ok=True)
+    save_records(records, paths["records"], datetime.now(ZoneInfo("Europe/Kyiv")))
+    return 0
+
+
+def cmd_build(args):
+    """
+    Calculates metrics from cached records and saves JSON and CSV.
+    """
+    paths = report_paths(args.date)
+    records, fetched_at = load_records(paths["records"])
+    if records is None:
+        print("Спочатку виконайте: python techflow_report.py fetch")
+        return 1
+
+    if not records:
+        print("Таблиця Requests порожня — немає даних для звіту")
+        return 1
+
+    sla_path = args.sla_config
+    if sla_path is None and os.path.exists(SLA_CONFIG_PATH):
+        sla_path = SLA_CONFIG_PATH
+    try:
+        sla_config = load_sla_config(sla_path)
+    except (OSError, ValueError) as e:
+        print(f"Помилка SLA налаштувань: {e}")
+        print("Перевірте файл за прикладом sla.example.json")
+        return 1
+
+    print("Перевірка якості даних...")
+    validation = validate_records(records, fetched_at, sla_config)
+
+    print("Розрахунок метрик...")
+    report = calculate_metrics(records, validation, now=fetched_at)
+    print_summary(report)
+
+    save_json(report, paths["dir"], os.path.basename(paths["json"]))
+    save_csv(report, paths["dir"], os.path.basename(paths["csv"]))
+    save_quarantine(validation["quarantine"], paths["dir"], os.path.basename(paths["quarantine"]))
+    return 0
+
+
+def cmd_render(args):
+    """
+    Generates HTML dashboard from saved JSON report.
+    """
+    from dashboard_html import generate_dashboard_html, save_dashboard
 
-    json_path = save_json(report, date_dir, f"techflow_report_{date_str}.json")
-    csv_path = save_csv(report, date_dir, f"techflow_report_{date_str}.csv")
+    paths = report_paths(args.date)
+    report = load_json(paths["json"])
+    if report is None:
+        print("Спочатку виконайте: python techflow_report.py build")
+        return 1
 
     dashboard_html = generate_dashboard_html(report)
-    dashboard_path = save_dashboard(dashboard_html, date_dir, f"techflow_dashboard_{date_str}.html")
+    save_dashboard(dashboard_html, paths["dir"], os.path.basename(paths["dashboard"]))
+    return 0
 
-    if email_configured:
+
+def cmd_send(args):
+    """
+    Sends saved report files to email.
+    """
+    config = load_config()
+    if not is_email_configured(config):
+        print("Email не налаштований — пропускаємо відправку")
+        return 1
+
+    paths = report_paths(args.date)
+    report = load_json(paths["json"])
+    if report is None:
+        print("Спочатку виконайте: python techflow_report.py build")
+        return 1
+
+    missing = [paths[key] for key in ("csv", "dashboard") if not os.path.exists(paths[key])]
+    if missing:
+        print(f"Файл не знайдено: {', '.join(missing)}")
+        return 1
+
+    print("Надсилання звіту на email...")
+    if not send_email(report, paths["csv"], paths["json"], paths["dashboard"], config):
+        return 1
+    return 0
+
+
+def cmd_run(args):
+    """
+    Performs the whole pipeline in sequence:
+    1. Check configuration (.env variables)
+    2. Get data from Airtable
+    3. Calculate metrics and output results to the console
+    4. Save to JSON, CSV and HTML dashboard
+    5. Send to email
+    """
+    print("=" * 60)
+    print("  TechFlow Consulting — Weekly Report Generator")
+    print("=" * 60)
+    print()
+
+    config = load_config()
+    if not check_required_config(config):
+        return 1
+
+    email_configured = is_email_configured(config)
+    if not email_configured:
+        print("Email не налаштований — звіт буде збережений тільки у файли")
         print()
-        print("Надсилання звіту на email...")
-        send_email(report, csv_path, json_path, dashboard_path)
+
+    for step in (cmd_fetch, cmd_build, cmd_render):
+        code = step(args)
+        if code:
+            return code
+
+    print()
+    if email_configured:
+        code = cmd_send(args)
+        if code:
+            return code
     else:
-        print()
         print("Email не налаштований — пропускаємо відправку")
 
     print()
     print("Готово!")
+    return 0
 
 
-if __name__ == "__main__":
-    main()
+def build_parser():
+    """
+    Builds command line parser with a subcommand per pipeline step.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--date", default=None,
+        help="дата звіту YYYY-MM-DD, визначає каталог reports/<date> "
+             "(типово: сьогодні для run і fetch, останній отриманий звіт для інших команд)",
+    )
+
+    sla = argparse.ArgumentParser(add_help=False)
+    sla.add_argument(
+        "--sla-config", default=None,
+        help=f"JSON з порогами SLA по послугах (типово: {SLA_CONFIG_PATH}, якщо існує)",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="techflow_report.py",
+        description="TechFlow Consulting — Weekly Report Generator",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    commands = [
+        ("run", cmd_run, [common, sla], "повний цикл: fetch, build, render, send (типово)"),
+        ("fetch", cmd_fetch, [common], "отримати записи з Airtable і зберегти їх локально"),
+        ("build", cmd_build, [common, sla], "розрахувати метрики зі збережених записів (JSON, CSV)"),
+        ("render", cmd_render, [common], "згенерувати HTML дашборд зі збереженого звіту"),
+        ("send", cmd_send, [common], "надіслати збережений звіт на email"),
+        ("validate-config", cmd_validate_config, [], "перевірити змінні середовища"),
+    ]
+    for name, handler, parents, help_text in commands:
+        subparser = subparsers.add_parser(name, parents=parents, help=help_text)
+        subparser.set_defaults(handler=handler)
+
+    parser.set_defaults(handler=cmd_run, date=None, sla_config=None)
+    return parser
+
 
+def main(argv=None):
+    """
+    Entry point into the application. Without a subcommand runs the full pipeline.
+    """
+    args = build_parser().parse_args(argv)
+    if args.date is None and args.handler is not cmd_validate_config:
+        today = datetime.now(ZoneInfo("Europe/Kyiv")).strftime("%Y-%m-%d")
+        if args.handler in (cmd_run, cmd_fetch):
+            args.date = today
+        else:
+            # build/render/send after midnight must pick up the directory of
+            # the last fetch, not an empty one for the new day.
+            args.date = latest_report_date() or today
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
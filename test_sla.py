@@ -0,0 +1,117 @@
+import json
+import random
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from sla import (
+    add_business_hours,
+    build_interval_index,
+    business_deadline,
+    business_time_index,
+    count_active,
+    hourly_moments,
+    load_sla_config,
+)
+
+
+@pytest.fixture
+def calendar(tmp_path):
+    path = tmp_path / "sla.json"
+    path.write_text(json.dumps({
+        "business_hours": {"holidays": ["2026-01-01", "2026-08-24", "2026-12-25"]},
+    }))
+    return load_sla_config(str(path))["business_hours"]
+
+
+def test_business_deadline_matches_add_business_hours(calendar):
+    """
+    The indexed deadline must agree with the day-by-day one, including
+    requests created outside working hours, on holidays and around DST.
+    """
+    rng = random.Random(42)
+    index = business_time_index(calendar, date(2025, 12, 30), date(2027, 3, 1))
+    year_start = datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    for _ in range(3000):
+        created_ts = year_start + rng.uniform(0, 365 * 86400)
+        hours = rng.choice([0.5, 1, 4, 9, 24, 40, 100])
+        created_at = datetime.fromtimestamp(created_ts, timezone.utc)
+
+        expected = add_business_hours(created_at, hours, calendar).timestamp()
+        assert business_deadline(created_ts, hours, index) == pytest.approx(expected, abs=1e-3)
+
+
+def test_business_deadline_outside_index(calendar):
+    index = business_time_index(calendar, date(2026, 10, 1), date(2026, 10, 31))
+
+    before = datetime(2026, 9, 15, 10, tzinfo=timezone.utc).timestamp()
+    assert business_deadline(before, 4, index) is None
+
+    near_end = datetime(2026, 10, 30, 10, tzinfo=timezone.utc).timestamp()
+    assert business_deadline(near_end, 100, index) is None
+
+
+@pytest.mark.parametrize("hours", [0, -1, "24", True])
+def test_load_sla_config_rejects_bad_hours(tmp_path, hours):
+    path = tmp_path / "sla.json"
+    path.write_text(json.dumps({"services": {"Audit": {"reaction_hours": hours}}}))
+
+    with pytest.raises(ValueError):
+        load_sla_config(str(path))
+
+
+@pytest.mark.parametrize("config", [
+    [1, 2],
+    {"services": [1]},
+    {"services": {"Audit": 4}},
+    {"default": "24h"},
+    {"business_hours": {"weekdays": [7]}},
+    {"business_hours": {"weekdays": []}},
+    {"business_hours": {"weekdays": "0-4"}},
+    {"business_hours": {"start": 9}},
+    {"business_hours": {"start": "18:00", "end": "09:00"}},
+    {"business_hours": {"timezone": "Mars/Base"}},
+    {"business_hours": {"holidays": ["2026-13-01"]}},
+    {"business_hours": {"holidays": [20260101]}},
+    {"default": {"business_hours": "yes"}},
+])
+def test_load_sla_config_rejects_invalid_structure(tmp_path, config):
+    path = tmp_path / "sla.json"
+    path.write_text(json.dumps(config))
+
+    with pytest.raises(ValueError):
+        load_sla_config(str(path))
+
+
+def test_load_sla_config_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        load_sla_config(str(tmp_path / "missing.json"))
+
+
+def test_count_active_matches_scan():
+    rng = random.Random(7)
+    intervals = []
+    for _ in range(500):
+        start = rng.uniform(0, 100)
+        intervals.append((start, rng.choice([start + rng.uniform(0, 20), float("inf")])))
+    moments = [rng.uniform(0, 130) for _ in range(200)]
+
+    expected = [sum(start <= t < end for start, end in intervals) for t in moments]
+    assert count_active(build_interval_index(intervals), moments) == expected
+
+
+@pytest.mark.parametrize("day, hours", [
+    (datetime(2026, 10, 25), 25),  # autumn: 03:00 happens twice
+    (datetime(2026, 3, 29), 23),   # spring: 03:00 does not exist
+])
+def test_hourly_moments_across_dst(day, hours):
+    kyiv = ZoneInfo("Europe/Kyiv")
+    since = day.replace(tzinfo=kyiv)
+    until = (day + timedelta(days=1)).replace(tzinfo=kyiv)
+
+    timestamps = [m.timestamp() for m in hourly_moments(since, until)]
+
+    assert len(timestamps) == hours + 1
+    assert {b - a for a, b in zip(timestamps, timestamps[1:])} == {3600}
@@ -0,0 +1,106 @@
+import csv
+from datetime import datetime, timezone
+
+import pytest
+
+from sla import DEFAULT_SLA_CONFIG
+from techflow_report import (
+    OVERDUE_STATUS,
+    calculate_metrics,
+    parse_datetime,
+    save_quarantine,
+    validate_records,
+)
+
+NOW = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+
+
+def record(record_id, status="New", assignee=None, **dates):
+    fields = {"Request ID": record_id.upper(), "Status": status}
+    for name, value in dates.items():
+        fields[name.replace("_", " ").title()] = value
+    if assignee:
+        fields["Assignee Name"] = [assignee]
+    return {"id": record_id, "fields": fields}
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-10-19T10:00:00.000Z", datetime(2026, 10, 19, 10, tzinfo=timezone.utc)),
+    ("2026-10-19T10:00:00.5Z", datetime(2026, 10, 19, 10, 0, 0, 500000, tzinfo=timezone.utc)),
+    ("2026-10-19T10:00:00Z", datetime(2026, 10, 19, 10, tzinfo=timezone.utc)),
+    ("2026-10-19T10:00:00", datetime(2026, 10, 19, 10, tzinfo=timezone.utc)),
+    ("2026-10-19", datetime(2026, 10, 19, tzinfo=timezone.utc)),
+])
+def test_parse_datetime_accepts_airtable_formats(value, expected):
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    None, "", 123, "20261019", "2026-W42-1", "2026-10-19T10:00:00+02:00",
+    "2026-10-19 10:00:00", "2026-10-19T10:00", "2026-02-30", "yesterday",
+])
+def test_parse_datetime_rejects_other_spellings(value):
+    assert parse_datetime(value) is None
+
+
+def test_validate_records_reason_codes():
+    records = [
+        record("ok", created_at="2026-10-19T09:00:00.000Z"),
+        record("missing"),
+        record("bad_created", created_at="20261019"),
+        record("bad_assigned", created_at="2026-10-19T09:00:00Z", assigned_at="soon"),
+        record("bad_closed", created_at="2026-10-19T09:00:00Z", closed_at="2026-W42-1"),
+        record("future", created_at="2026-10-20T09:00:00Z"),
+        record("early_assign", created_at="2026-10-19T09:00:00Z", assigned_at="2026-10-18T09:00:00Z"),
+        record("early_close", created_at="2026-10-19T09:00:00Z", closed_at="2026-10-18T09:00:00Z"),
+        record("mismatch", status=OVERDUE_STATUS, created_at="2026-10-19T09:00:00Z"),
+    ]
+
+    validation = validate_records(records, NOW, DEFAULT_SLA_CONFIG)
+
+    reasons = {row["record_id"]: (row["reasons"], row["excluded"]) for row in validation["quarantine"]}
+    assert reasons == {
+        "missing": (["missing_created_at"], True),
+        "bad_created": (["invalid_created_at"], True),
+        "bad_assigned": (["invalid_assigned_at"], True),
+        "bad_closed": (["invalid_closed_at"], True),
+        "future": (["created_in_future"], True),
+        "early_assign": (["assigned_before_created"], True),
+        "early_close": (["closed_before_created"], True),
+        "mismatch": (["overdue_status_mismatch"], False),
+    }
+    assert validation["quarantined_count"] == 7
+    assert [r["request_id"] for r in validation["requests"]] == ["OK", "MISMATCH"]
+    assert sum(validation["anomaly_counts"].values()) == 8
+    assert validation["anomaly_counts"]["overdue_status_mismatch"] == 1
+
+
+def test_overdue_status_matches_reaction_breach():
+    records = [
+        # Assigned in time, still open: not overdue for reaction.
+        record("in_time", created_at="2026-10-15T09:00:00Z", assigned_at="2026-10-15T10:00:00Z"),
+        # Not assigned after 24 hours: overdue, and the status says so.
+        record("late", status=OVERDUE_STATUS, assignee="Ann", created_at="2026-10-15T09:00:00Z"),
+    ]
+
+    validation = validate_records(records, NOW, DEFAULT_SLA_CONFIG)
+
+    assert validation["anomaly_counts"]["overdue_status_mismatch"] == 0
+    assert [r["overdue"] for r in validation["requests"]] == [False, True]
+
+    metrics = calculate_metrics(records, validation, now=NOW)["metrics"]
+    assert metrics["consultant_workload"] == {"Ann": 1}
+
+
+def test_save_quarantine(tmp_path):
+    records = [record("bad", created_at="2026-10-19T09:00:00Z", closed_at="2026-10-18T09:00:00Z")]
+    validation = validate_records(records, NOW, DEFAULT_SLA_CONFIG)
+
+    path = save_quarantine(validation["quarantine"], str(tmp_path), "quarantine.csv")
+
+    with open(path, encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[1] == [
+        "bad", "BAD", "New", "2026-10-19T09:00:00Z", "", "2026-10-18T09:00:00Z",
+        "closed_before_created", "True",
+    ]